@@ -7,15 +7,27 @@
 import pygame
 import pymunk
 import os
-from typing import List, Tuple, Optional
+import math
+import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Tuple, Optional
 
 from constants import (
-    IMAGES_PATH, ANIMAL_SCALE,
+    IMAGES_PATH, ANIMAL_IMAGES, ANIMAL_SCALE, NEXT_PREVIEW_SIZE,
     ANIMAL_MASS, ANIMAL_FRICTION, ANIMAL_ELASTICITY,
-    SETTLE_VELOCITY_THRESHOLD
+    SETTLE_VELOCITY_THRESHOLD_SQ
 )
 from polygon_extractor import extract_polygon_from_surface, get_fallback_polygon
 
+# 라디안 -> 도 변환 계수
+_RAD2DEG = 180.0 / math.pi
+
+# 종류별 데이터 테이블
+# image_name -> {"image", "preview", "polygon", "verts", "mass", "moment"}
+# 디스플레이 설정 후 Animal.preload_all()에서 한 번에 채우며, 스폰과 UI 모두 여기서 읽습니다.
+SPECIES: Dict[str, dict] = {}
+
 
 class AnimalState:
     """동물 상태 열거형"""
@@ -32,9 +44,11 @@ class Animal:
     - 상태 관리 (조종 중, 떨어지는 중, 안착됨)
     """
     
-    # 클래스 레벨 캐시 (이미지, 폴리곤)
-    _image_cache = {}
-    _polygon_cache = {}
+    # 회전/스케일된 이미지 LRU 캐시 (image_name, 각도 키, 줌 키) -> Surface
+    _rotscale_cache: "OrderedDict[Tuple[str, int, int], pygame.Surface]" = OrderedDict()
+    ROTSCALE_CACHE_SIZE = 512
+    ANGLE_STEP = 3.0  # 각도 양자화 단위 (도, 3도 차이는 눈에 띄지 않음)
+    ZOOM_STEP = 0.05  # 줌 양자화 단위
     
     def __init__(self, image_name: str, physics_manager, 
                  x: float, y: float, is_static: bool = False):
@@ -52,17 +66,17 @@ class Animal:
         self.physics_manager = physics_manager
         self.state = AnimalState.CONTROLLED if is_static else AnimalState.FALLING
         
-        # 이미지 로드 (캐시 사용)
-        self.image = self._load_image(image_name)
+        # 종류별 데이터 (preload_all()로 미리 채워져 있어야 함)
+        self.species = SPECIES[image_name]
+        self.image = self.species["image"]
         self.width = self.image.get_width()
         self.height = self.image.get_height()
-        
-        # 폴리곤 추출 (캐시 사용)
-        self.polygon = self._get_polygon(image_name)
+        self.polygon = self.species["polygon"]
         
         # Pymunk 바디 & 셰이프 생성
         self.body: Optional[pymunk.Body] = None
         self.shape: Optional[pymunk.Poly] = None
+        self._verts_np: Optional[np.ndarray] = None
         self.is_static = is_static
         
         self._create_physics_body(x, y, is_static)
@@ -71,30 +85,43 @@ class Animal:
         self.settle_timer = 0.0
     
     @classmethod
-    def _load_image(cls, image_name: str) -> pygame.Surface:
-        """이미지를 로드하고 스케일링합니다 (캐시 사용)."""
-        if image_name in cls._image_cache:
-            return cls._image_cache[image_name]
+    def preload_all(cls):
+        """
+        모든 동물 종류의 데이터를 미리 계산해 SPECIES 테이블을 채웁니다.
         
+        첫 스폰 시 디스크 I/O와 폴리곤 추출로 프레임이 끊기지 않도록,
+        디스플레이 모드 설정 후(convert_alpha 필요) 게임 시작 전에 호출합니다.
+        이미지 로드는 GIL을 해제하므로 스레드 풀로 병렬 처리합니다.
+        """
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            entries = list(executor.map(cls._build_species, ANIMAL_IMAGES))
+        SPECIES.update(zip(ANIMAL_IMAGES, entries))
+    
+    @staticmethod
+    def _build_species(image_name: str) -> dict:
+        """이미지를 로드해 한 종류의 이미지/미리보기/폴리곤/질량/모멘트를 계산합니다."""
         path = os.path.join(IMAGES_PATH, image_name)
         original = pygame.image.load(path).convert_alpha()
         
-        # 스케일링
+        # 게임용 스케일링
         new_width = int(original.get_width() * ANIMAL_SCALE)
         new_height = int(original.get_height() * ANIMAL_SCALE)
-        scaled = pygame.transform.smoothscale(original, (new_width, new_height))
+        image = pygame.transform.smoothscale(original, (new_width, new_height))
         
-        cls._image_cache[image_name] = scaled
-        return scaled
-    
-    @classmethod
-    def _get_polygon(cls, image_name: str) -> List[Tuple[float, float]]:
-        """이미지에서 폴리곤을 추출합니다 (캐시 사용)."""
-        if image_name in cls._polygon_cache:
-            return cls._polygon_cache[image_name]
+        # 미리보기 크기에 맞게 조정 (원본은 여기서만 쓰고 버림)
+        aspect = original.get_width() / original.get_height()
+        preview_height = NEXT_PREVIEW_SIZE[1] - 20
+        preview_width = int(preview_height * aspect)
+        
+        if preview_width > NEXT_PREVIEW_SIZE[0] - 20:
+            preview_width = NEXT_PREVIEW_SIZE[0] - 20
+            preview_height = int(preview_width / aspect)
         
-        image = cls._load_image(image_name)
+        preview = pygame.transform.smoothscale(
+            original, (preview_width, preview_height)
+        ).convert_alpha()
         
+        # 폴리곤 추출
         try:
             polygon = extract_polygon_from_surface(image, 
                                                    simplify_tolerance=3.0, 
@@ -103,8 +130,43 @@ class Animal:
             print(f"폴리곤 추출 실패 ({image_name}): {e}")
             polygon = get_fallback_polygon(image.get_width(), image.get_height())
         
-        cls._polygon_cache[image_name] = polygon
-        return polygon
+        # 모든 인스턴스가 공유하므로 불변 튜플로 저장
+        polygon = tuple(map(tuple, polygon))
+        
+        return {
+            "image": image,
+            "preview": preview,
+            "polygon": polygon,
+            "verts": np.array(polygon, dtype=np.float32),
+            "mass": ANIMAL_MASS,
+            "moment": pymunk.moment_for_poly(ANIMAL_MASS, polygon),
+        }
+    
+    @classmethod
+    def _get_transformed_image(cls, image_name: str, ang_key: int,
+                               zoom_key: int) -> Optional[pygame.Surface]:
+        """양자화된 각도/줌으로 변환된 이미지를 반환합니다 (LRU 캐시 사용)."""
+        key = (image_name, ang_key, zoom_key)
+        cached = cls._rotscale_cache.get(key)
+        if cached is not None:
+            cls._rotscale_cache.move_to_end(key)
+            return cached
+        
+        image = SPECIES[image_name]["image"]
+        zoom = zoom_key * cls.ZOOM_STEP
+        
+        if zoom < 1 / max(image.get_width(), image.get_height()):
+            return None
+        
+        # 이미지 스케일 및 회전 (한 번의 패스로 처리)
+        # 디스플레이 픽셀 포맷으로 변환해 두어 블릿 시 포맷 변환 생략
+        transformed = pygame.transform.rotozoom(image, ang_key * cls.ANGLE_STEP, zoom)
+        transformed = transformed.convert_alpha()
+        
+        cls._rotscale_cache[key] = transformed
+        if len(cls._rotscale_cache) > cls.ROTSCALE_CACHE_SIZE:
+            cls._rotscale_cache.popitem(last=False)
+        return transformed
     
     def _create_physics_body(self, x: float, y: float, is_static: bool):
         """Pymunk 물리 바디를 생성합니다."""
@@ -113,22 +175,23 @@ class Animal:
             self.body = pymunk.Body(body_type=pymunk.Body.KINEMATIC)
         else:
             # 동적 바디 (중력 영향 O)
-            moment = pymunk.moment_for_poly(ANIMAL_MASS, self.polygon)
-            self.body = pymunk.Body(ANIMAL_MASS, moment)
+            self.body = pymunk.Body(self.species["mass"], self.species["moment"])
         
         self.body.position = (x, y)
         
         # 폴리곤 셰이프 생성
+        # 디버그 렌더링용 로컬 꼭짓점 배열은 종류별 테이블의 것을 공유
         try:
             self.shape = pymunk.Poly(self.body, self.polygon)
+            self._verts_np = self.species["verts"]
         except Exception as e:
             print(f"폴리곤 셰이프 생성 실패: {e}")
             # 폴백: 박스 셰이프
             hw = self.width / 2 * 0.9
             hh = self.height / 2 * 0.9
-            self.shape = pymunk.Poly(self.body, [
-                (-hw, -hh), (hw, -hh), (hw, hh), (-hw, hh)
-            ])
+            box = [(-hw, -hh), (hw, -hh), (hw, hh), (-hw, hh)]
+            self.shape = pymunk.Poly(self.body, box)
+            self._verts_np = np.array(box, dtype=np.float32)
         
         self.shape.friction = ANIMAL_FRICTION
         self.shape.elasticity = ANIMAL_ELASTICITY
@@ -142,14 +205,10 @@ class Animal:
         if self.state != AnimalState.CONTROLLED:
             return
         
-        # 현재 위치 저장
-        pos = self.body.position
-        
-        # 기존 바디/셰이프 제거
-        self.physics_manager.remove_body(self.body, [self.shape])
-        
-        # 동적 바디로 재생성
-        self._create_physics_body(pos.x, pos.y, is_static=False)
+        # 바디 타입만 동적으로 전환 (기존 바디/셰이프를 그대로 재사용)
+        self.body.body_type = pymunk.Body.DYNAMIC
+        self.body.mass = self.species["mass"]
+        self.body.moment = self.species["moment"]
         self.is_static = False
         self.state = AnimalState.FALLING
     
@@ -177,9 +236,9 @@ class Animal:
         # 속도 체크로 안착 판정
         if self.body:
             velocity = self.body.velocity
-            speed = (velocity.x ** 2 + velocity.y ** 2) ** 0.5
+            speed_sq = velocity.x * velocity.x + velocity.y * velocity.y
             
-            if speed < SETTLE_VELOCITY_THRESHOLD:
+            if speed_sq < SETTLE_VELOCITY_THRESHOLD_SQ:
                 self.settle_timer += dt
                 if self.settle_timer > 0.3:  # 0.3초 이상 느린 상태
                     self.state = AnimalState.SETTLED
@@ -204,22 +263,31 @@ class Animal:
         world_pos = self.body.position
         screen_pos = camera.world_to_screen(world_pos.x, world_pos.y)
         
+        self.draw_at(screen, screen_pos, camera.zoom)
+    
+    def draw_at(self, screen: pygame.Surface, screen_pos: tuple, zoom: float):
+        """
+        이미 변환된 스크린 좌표에 동물을 렌더링합니다.
+        
+        Args:
+            screen: Pygame 화면 Surface
+            screen_pos: 동물 중심의 스크린 좌표
+            zoom: 카메라 줌 레벨
+        """
+        if not self.body:
+            return
+        
         # 회전 적용
-        angle_degrees = -self.body.angle * 180 / 3.14159
+        angle_degrees = -self.body.angle * _RAD2DEG
         
-        # 줌 적용
-        zoom = camera.zoom
-        scaled_width = int(self.width * zoom)
-        scaled_height = int(self.height * zoom)
+        # 각도/줌 양자화 후 캐시된 이미지 사용
+        ang_key = round(angle_degrees / self.ANGLE_STEP) % int(360 / self.ANGLE_STEP)
+        zoom_key = round(zoom / self.ZOOM_STEP)
         
-        if scaled_width < 1 or scaled_height < 1:
+        rotated_image = self._get_transformed_image(self.image_name, ang_key, zoom_key)
+        if rotated_image is None:
             return
         
-        # 이미지 스케일 및 회전
-        scaled_image = pygame.transform.smoothscale(self.image, 
-                                                     (scaled_width, scaled_height))
-        rotated_image = pygame.transform.rotate(scaled_image, angle_degrees)
-        
         # 중심 위치 계산
         rect = rotated_image.get_rect(center=(int(screen_pos[0]), int(screen_pos[1])))
         screen.blit(rotated_image, rect)
@@ -229,20 +297,21 @@ class Animal:
         if not self.body or not self.shape:
             return
         
-        # 셰이프의 실제 꼭짓점 가져오기
-        vertices = self.shape.get_vertices()
+        if len(self._verts_np) < 3:
+            return
+        
+        # 로컬 꼭짓점 -> 월드 좌표 (회전 + 이동을 한 번에)
+        angle = self.body.angle
+        c, s = math.cos(angle), math.sin(angle)
+        rotation = np.array([[c, -s], [s, c]], dtype=np.float32)
+        position = self.body.position
+        world = self._verts_np @ rotation.T + np.array([position.x, position.y], 
+                                                        dtype=np.float32)
         
-        # 월드 좌표로 변환
-        world_vertices = []
-        for v in vertices:
-            rotated = v.rotated(self.body.angle)
-            world_x = self.body.position.x + rotated.x
-            world_y = self.body.position.y + rotated.y
-            screen_pos = camera.world_to_screen(world_x, world_y)
-            world_vertices.append(screen_pos)
+        # 월드 좌표 -> 스크린 좌표 (카메라 변환)
+        screen_vertices = camera.world_to_screen_array(world)
         
-        if len(world_vertices) >= 3:
-            pygame.draw.polygon(screen, (255, 0, 0), world_vertices, 2)
+        pygame.draw.polygon(screen, (255, 0, 0), screen_vertices.tolist(), 2)
     
     @property
     def position(self) -> Tuple[float, float]:
@@ -7,6 +7,7 @@
 import pygame
 import math
 import random
+import numpy as np
 from constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT,
     SKY_BLUE, SKY_BLUE_LIGHT, WHITE
@@ -16,39 +17,58 @@ from constants import (
 class Cloud:
     """간단한 구름 오브젝트"""
     
+    # 스케일별 구름 스프라이트 캐시 (모양은 스케일로만 결정됨)
+    _sprite_cache = {}
+    
     def __init__(self, x: float, y: float, scale: float):
-        self.x = x
-        self.y = y
-        self.scale = scale
+        self.fx = x  # 실수 X 좌표 (이동량 누적용)
+        self.x = int(x)  # 그리기용 정수 좌표
+        self.y = int(y)
+        self.scale = round(scale, 1)  # 0.1 단위로 양자화 (스프라이트 공유)
         self.speed = random.uniform(5, 15)  # 이동 속도
+        
+        # 미리 그려둔 구름 스프라이트와 중심 오프셋
+        self.sprite, self.offset = self._get_sprite(self.scale)
     
-    def update(self, dt: float, camera_offset_y: float):
-        """구름 위치 업데이트 (천천히 이동)"""
-        self.x += self.speed * dt
-        if self.x > SCREEN_WIDTH + 100:
-            self.x = -100
+    @classmethod
+    def _get_sprite(cls, scale: float) -> tuple:
+        """구름 스프라이트를 생성합니다 (캐시 사용)."""
+        if scale in cls._sprite_cache:
+            return cls._sprite_cache[scale]
+        
+        # 여러 원으로 구름 모양 생성 (중심 기준 dx, dy, 반지름)
+        base_radius = int(25 * scale)
+        blobs = [
+            (0, 0, base_radius),
+            (-base_radius * 0.7, 5, int(base_radius * 0.8)),
+            (base_radius * 0.7, 5, int(base_radius * 0.8)),
+            (-base_radius * 0.3, -base_radius * 0.4, int(base_radius * 0.6)),
+            (base_radius * 0.4, -base_radius * 0.3, int(base_radius * 0.7)),
+        ]
+        
+        # 원들을 모두 포함하는 영역 계산
+        left = int(min(dx - r for dx, dy, r in blobs)) - 1
+        top = int(min(dy - r for dx, dy, r in blobs)) - 1
+        right = int(max(dx + r for dx, dy, r in blobs)) + 1
+        bottom = int(max(dy + r for dx, dy, r in blobs)) + 1
+        
+        sprite = pygame.Surface((right - left, bottom - top), pygame.SRCALPHA)
+        for dx, dy, r in blobs:
+            pygame.draw.circle(sprite, WHITE, (int(dx - left), int(dy - top)), r)
+        sprite = sprite.convert_alpha()
+        
+        cls._sprite_cache[scale] = (sprite, (-left, -top))
+        return cls._sprite_cache[scale]
     
     def draw(self, screen: pygame.Surface):
         """구름 그리기"""
-        # 여러 원으로 구름 모양 생성
-        base_radius = int(25 * self.scale)
+        left = self.x - self.offset[0]
+        
+        # 화면 밖이면 생략
+        if left > SCREEN_WIDTH or left + self.sprite.get_width() < 0:
+            return
         
-        # 구름 중심 부분
-        pygame.draw.circle(screen, WHITE, 
-                          (int(self.x), int(self.y)), 
-                          base_radius)
-        pygame.draw.circle(screen, WHITE, 
-                          (int(self.x - base_radius * 0.7), int(self.y + 5)), 
-                          int(base_radius * 0.8))
-        pygame.draw.circle(screen, WHITE, 
-                          (int(self.x + base_radius * 0.7), int(self.y + 5)), 
-                          int(base_radius * 0.8))
-        pygame.draw.circle(screen, WHITE, 
-                          (int(self.x - base_radius * 0.3), int(self.y - base_radius * 0.4)), 
-                          int(base_radius * 0.6))
-        pygame.draw.circle(screen, WHITE, 
-                          (int(self.x + base_radius * 0.4), int(self.y - base_radius * 0.3)), 
-                          int(base_radius * 0.7))
+        screen.blit(self.sprite, (left, self.y - self.offset[1]))
 
 
 class Background:
@@ -77,26 +97,32 @@ class Background:
     
     def _create_sky_gradient(self):
         """하늘 그라데이션 서피스 생성"""
-        self.sky_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # 위에서 아래로 그라데이션 (행 단위 색상을 한 번에 계산)
+        ratio = (np.arange(SCREEN_HEIGHT, dtype=np.float32) / SCREEN_HEIGHT)[:, None]
+        top = np.array(SKY_BLUE_LIGHT, dtype=np.float32)
+        bottom = np.array(SKY_BLUE, dtype=np.float32)
+        rows = (top + (bottom - top) * ratio).astype(np.uint8)
         
-        for y in range(SCREEN_HEIGHT):
-            # 위에서 아래로 그라데이션
-            ratio = y / SCREEN_HEIGHT
-            r = int(SKY_BLUE_LIGHT[0] + (SKY_BLUE[0] - SKY_BLUE_LIGHT[0]) * ratio)
-            g = int(SKY_BLUE_LIGHT[1] + (SKY_BLUE[1] - SKY_BLUE_LIGHT[1]) * ratio)
-            b = int(SKY_BLUE_LIGHT[2] + (SKY_BLUE[2] - SKY_BLUE_LIGHT[2]) * ratio)
-            pygame.draw.line(self.sky_surface, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+        # (H, 3) -> (W, H, 3): surfarray는 x축이 먼저
+        pixels = np.ascontiguousarray(
+            np.broadcast_to(rows[None, :, :], (SCREEN_WIDTH, SCREEN_HEIGHT, 3))
+        )
+        # 하늘은 불투명하므로 알파 없는 디스플레이 포맷으로 변환
+        self.sky_surface = pygame.surfarray.make_surface(pixels).convert()
     
-    def update(self, dt: float, camera_offset_y: float = 0):
+    def update(self, dt: float):
         """
         배경 업데이트
         
         Args:
             dt: 델타 타임
-            camera_offset_y: 카메라 Y 오프셋 (패럴랙스용)
         """
+        # 구름 위치 업데이트 (천천히 이동, 화면 오른쪽 밖으로 나가면 왼쪽에서 재등장)
         for cloud in self.clouds:
-            cloud.update(dt, camera_offset_y)
+            cloud.fx += cloud.speed * dt
+            if cloud.fx > SCREEN_WIDTH + 100:
+                cloud.fx = -100
+            cloud.x = int(cloud.fx)
     
     def draw(self, screen: pygame.Surface):
         """
@@ -4,12 +4,18 @@
 동적 줌아웃과 부드러운 카메라 추적을 처리합니다.
 """
 
+import numpy as np
 from constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT,
     MIN_ZOOM, MAX_ZOOM, ZOOM_SPEED, CAMERA_SMOOTH,
     PLATFORM_Y
 )
 
+# 탑 높이 -> 줌 감소량 계수 (800픽셀당 0.3)
+_HEIGHT_FACTOR_K = 0.3 / 800.0
+# 컨텐츠가 화면에 들어오는지 판정하는 기준 높이 (화면의 80%)
+_SH_0_8 = SCREEN_HEIGHT * 0.8
+
 
 class Camera:
     """
@@ -23,6 +29,11 @@ class Camera:
         """카메라를 초기화합니다."""
         self.zoom = MAX_ZOOM  # 현재 줌 레벨
         self.target_zoom = MAX_ZOOM  # 목표 줌 레벨
+        self._inv_zoom = 1.0 / self.zoom  # 줌 역수 (역변환용)
+        
+        # 화면 중심 (좌표 변환용)
+        self._sw_half = SCREEN_WIDTH * 0.5
+        self._sh_half = SCREEN_HEIGHT * 0.5
         
         # 카메라 중심 위치 (월드 좌표)
         self.center_x = SCREEN_WIDTH / 2
@@ -44,24 +55,23 @@ class Camera:
         """
         # 줌 레벨 계산 (탑이 높을수록 줌아웃)
         # 탑 높이 0 -> 줌 1.0, 탑 높이 증가 -> 줌 감소
-        height_factor = tower_height / 800  # 800픽셀 기준
-        self.target_zoom = max(MIN_ZOOM, MAX_ZOOM - height_factor * 0.3)
+        target_zoom = MAX_ZOOM - tower_height * _HEIGHT_FACTOR_K
+        self.target_zoom = MIN_ZOOM if target_zoom < MIN_ZOOM else target_zoom
         
         # 줌 부드럽게 보간
         self.zoom += (self.target_zoom - self.zoom) * ZOOM_SPEED
         
         # 카메라 Y 위치 계산
         # 탑 꼭대기와 현재 동물이 모두 화면에 보이도록
-        visible_height = SCREEN_HEIGHT / self.zoom
-        
         # 플랫폼 위치 기준으로 필요한 영역 계산
         min_y = min(current_animal_y, self.base_y - tower_height)
         max_y = self.base_y + 50
         
         # 카메라 중심은 보여야 할 영역의 중간 약간 아래
+        # content_height > (SCREEN_HEIGHT / zoom) * 0.8 을 나눗셈 없이 비교
         content_height = max_y - min_y
         
-        if content_height > visible_height * 0.8:
+        if content_height * self.zoom > _SH_0_8:
             # 컨텐츠가 화면보다 클 때 - 줌 아웃 필요
             self.target_center_y = (min_y + max_y) / 2
         else:
@@ -70,6 +80,13 @@ class Camera:
         
         # 카메라 Y 부드럽게 보간
         self.center_y += (self.target_center_y - self.center_y) * CAMERA_SMOOTH
+        
+        self._inv_zoom = 1.0 / self.zoom
+    
+    @property
+    def state(self) -> tuple:
+        """좌표 변환 결과를 결정하는 카메라 상태 (캐시 키로 사용)."""
+        return (self.center_x, self.center_y, self.zoom)
     
     def world_to_screen(self, world_x: float, world_y: float) -> tuple:
         """
@@ -87,11 +104,25 @@ class Camera:
         offset_y = world_y - self.center_y
         
         # 줌 적용
-        screen_x = SCREEN_WIDTH / 2 + offset_x * self.zoom
-        screen_y = SCREEN_HEIGHT / 2 + offset_y * self.zoom
+        screen_x = self._sw_half + offset_x * self.zoom
+        screen_y = self._sh_half + offset_y * self.zoom
         
         return (screen_x, screen_y)
     
+    def world_to_screen_array(self, world_points: np.ndarray) -> np.ndarray:
+        """
+        여러 월드 좌표를 한 번에 스크린 좌표로 변환합니다.
+        
+        Args:
+            world_points: (N, 2) 월드 좌표 배열
+        
+        Returns:
+            (N, 2) 스크린 좌표 배열
+        """
+        center = np.array((self.center_x, self.center_y), dtype=world_points.dtype)
+        half_screen = np.array((self._sw_half, self._sh_half), dtype=world_points.dtype)
+        return (world_points - center) * self.zoom + half_screen
+    
     def screen_to_world(self, screen_x: float, screen_y: float) -> tuple:
         """
         스크린 좌표를 월드 좌표로 변환합니다.
@@ -104,8 +135,8 @@ class Camera:
             (world_x, world_y) 튜플
         """
         # 역변환
-        offset_x = (screen_x - SCREEN_WIDTH / 2) / self.zoom
-        offset_y = (screen_y - SCREEN_HEIGHT / 2) / self.zoom
+        offset_x = (screen_x - self._sw_half) * self._inv_zoom
+        offset_y = (screen_y - self._sh_half) * self._inv_zoom
         
         world_x = self.center_x + offset_x
         world_y = self.center_y + offset_y
@@ -116,6 +147,7 @@ class Camera:
         """카메라를 초기 상태로 리셋합니다."""
         self.zoom = MAX_ZOOM
         self.target_zoom = MAX_ZOOM
+        self._inv_zoom = 1.0 / self.zoom
         self.center_x = SCREEN_WIDTH / 2
         self.center_y = SCREEN_HEIGHT / 2
         self.target_center_y = self.center_y
@@ -18,8 +18,12 @@ GAME_TITLE = "동물 탑 쌓기 (Animal Tower Stacking)"
 # 물리 설정 (Physics Settings)
 # ============================================================================
 GRAVITY = (0, 900)  # 중력 (x, y) - y가 양수면 아래로
-PHYSICS_STEPS = 10  # 프레임당 물리 시뮬레이션 스텝 수
+PHYSICS_STEPS = 10  # 안정성 배율 (솔버 반복 횟수 = PHYSICS_STEPS * 10)
+PHYSICS_ITERATIONS = max(10, PHYSICS_STEPS * 10)  # 스텝당 솔버 반복 횟수
+PHYSICS_MAX_FRAME_TIME = 1 / 30  # 한 스텝의 최대 시간 (멈춤 후 큰 dt로 인한 관통 방지)
 DAMPING = 0.7  # 공간 감쇠 (0~1, 낮을수록 더 빨리 멈춤)
+SLEEP_TIME_THRESHOLD = 0.5  # 이 시간(초) 동안 멈춰 있으면 바디 수면 (솔버에서 제외)
+IDLE_SPEED_THRESHOLD = 1.0  # 이 속도 이하면 멈춘 것으로 간주
 
 # 동물 물리 속성
 ANIMAL_MASS = 10  # 기본 질량
@@ -39,6 +43,7 @@ DROP_IMPULSE = 50  # 드롭 시 추가 아래쪽 힘
 
 # 안착 판정
 SETTLE_VELOCITY_THRESHOLD = 30  # 이 속도 이하면 안착으로 판정
+SETTLE_VELOCITY_THRESHOLD_SQ = SETTLE_VELOCITY_THRESHOLD ** 2  # 제곱 비교용 (sqrt 생략)
 SETTLE_TIME = 0.5  # 이 시간(초) 동안 느린 상태 유지 시 안착
 
 # 게임 오버 판정
@@ -59,6 +64,10 @@ CAMERA_SMOOTH = 0.05  # 카메라 이동 부드러움
 BASE_PATH = os.path.dirname(os.path.abspath(__file__))
 IMAGES_PATH = os.path.join(BASE_PATH, "animal_tower_images")
 
+# 추출한 충돌 다각형 디스크 캐시 위치
+POLYGON_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", 
+                                 "animal_tower", "polys")
+
 ANIMAL_IMAGES = [
     "bear.png",
     "dog.png",
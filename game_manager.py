@@ -5,6 +5,8 @@
 """
 
 import random
+import numpy as np
+import pygame
 from typing import List, Optional
 
 from constants import (
@@ -34,8 +36,10 @@ class GameManager:
         self.camera = Camera()
         self.platform: Optional[Platform] = None
         
-        # 동물 관련
+        # 동물 관련 (animals는 그리기 순서 유지, 나머지는 상태별 분할)
         self.animals: List[Animal] = []
+        self._active_animals: List[Animal] = []  # 아직 안착하지 않은 동물
+        self._settled_animals: List[Animal] = []  # 안착한 동물
         self.current_animal: Optional[Animal] = None
         self.next_animal_name: str = ""
         
@@ -51,18 +55,19 @@ class GameManager:
     
     def start_game(self):
         """새 게임을 시작합니다."""
-        # 기존 객체 정리
+        # 기존 객체 정리 (물리 공간은 비우고 재사용)
         self._cleanup()
         
-        # 물리 공간 초기화
-        self.physics_manager = PhysicsManager()
-        self.camera = Camera()
+        # 카메라 초기화
+        self.camera.reset()
         
         # 플랫폼 생성
         self.platform = Platform(self.physics_manager)
         
         # 상태 초기화
         self.animals = []
+        self._active_animals = []
+        self._settled_animals = []
         self.score = 0
         self.max_height = 0
         self.tower_height = 0
@@ -78,6 +83,8 @@ class GameManager:
         for animal in self.animals:
             animal.cleanup()
         self.animals.clear()
+        self._active_animals.clear()
+        self._settled_animals.clear()
         
         if self.current_animal:
             self.current_animal.cleanup()
@@ -109,12 +116,12 @@ class GameManager:
             is_static=True
         )
     
-    def handle_input(self, keys_pressed: dict, key_down_event=None):
+    def handle_input(self, keys_pressed, key_down_event=None):
         """
         플레이어 입력을 처리합니다.
         
         Args:
-            keys_pressed: 현재 눌린 키 상태
+            keys_pressed: 현재 눌린 키 상태 (pygame.key.get_pressed() 결과)
             key_down_event: 키 다운 이벤트 (옵션)
         """
         if self.state != GameState.PLAYING:
@@ -124,9 +131,9 @@ class GameManager:
             return
         
         # 좌우 이동
-        if keys_pressed.get('left', False):
+        if keys_pressed[pygame.K_LEFT]:
             self.current_animal.move(-MOVE_SPEED)
-        if keys_pressed.get('right', False):
+        if keys_pressed[pygame.K_RIGHT]:
             self.current_animal.move(MOVE_SPEED)
         
         # 드롭 (스페이스바 또는 아래 화살표)
@@ -146,6 +153,7 @@ class GameManager:
         
         # 동물 리스트에 추가
         self.animals.append(self.current_animal)
+        self._active_animals.append(self.current_animal)
         self.current_animal = None
     
     def update(self, dt: float):
@@ -161,42 +169,48 @@ class GameManager:
         # 물리 시뮬레이션
         self.physics_manager.step(dt)
         
-        # 동물 업데이트
-        settled_count = 0
+        # 안착 판정 (움직이는 동물만 검사, 안착하면 안착 목록으로 이동)
+        still_active = []
+        for animal in self._active_animals:
+            if animal.update(dt):
+                self._settled_animals.append(animal)
+            else:
+                still_active.append(animal)
+        self._active_animals = still_active
+        
+        # 이탈 체크 (안착한 동물도 밀려 떨어질 수 있으므로 전체 대상)
         animals_to_remove = []
         
         for animal in self.animals:
-            animal.update(dt)
-            
-            if animal.state == AnimalState.SETTLED:
-                settled_count += 1
-            
             # 게임 오버 체크 (화면 밖으로 떨어짐)
-            pos = animal.position
-            if pos[1] > GAME_OVER_Y:
+            body_pos = animal.body.position
+            px, py = body_pos.x, body_pos.y
+            if py > GAME_OVER_Y:
                 self._game_over()
                 return
             
             # 옆으로 너무 멀리 벗어난 경우도 제거 (옵션)
-            if pos[0] < -GAME_OVER_X_MARGIN or pos[0] > SCREEN_WIDTH + GAME_OVER_X_MARGIN:
+            if px < -GAME_OVER_X_MARGIN or px > SCREEN_WIDTH + GAME_OVER_X_MARGIN:
                 animals_to_remove.append(animal)
         
-        # 벗어난 동물 제거
-        for animal in animals_to_remove:
-            animal.cleanup()
-            self.animals.remove(animal)
+        # 벗어난 동물 제거 (cleanup 후 바디가 없는 동물을 모든 목록에서 제외)
+        if animals_to_remove:
+            for animal in animals_to_remove:
+                animal.cleanup()
+            self.animals = [a for a in self.animals if a.body is not None]
+            self._active_animals = [a for a in self._active_animals if a.body is not None]
+            self._settled_animals = [a for a in self._settled_animals if a.body is not None]
         
         # 점수 계산
-        self.score = settled_count
+        self.score = len(self._settled_animals)
         
         # 탑 높이 계산
         self._calculate_tower_height()
         
-        # 현재 동물이 없고 게임 진행 중이면 새 동물 스폰
-        if self.current_animal is None and self.state == GameState.PLAYING:
-            # 마지막 동물이 안착했는지 확인
-            all_settled = all(a.state == AnimalState.SETTLED for a in self.animals)
-            if all_settled or len(self.animals) == 0:
+        # 현재 동물이 없으면 새 동물 스폰 (게임 오버 시 위에서 이미 반환됨)
+        if self.current_animal is None:
+            # 마지막 동물이 안착했는지 확인 (동물이 없을 때도 스폰)
+            if not self._active_animals:
                 self._spawn_next_animal()
         
         # 카메라 업데이트
@@ -206,18 +220,13 @@ class GameManager:
         self.camera.update(self.tower_height, current_y, dt)
     
     def _calculate_tower_height(self):
-        """탑 높이를 계산합니다."""
-        if not self.animals:
-            self.tower_height = 0
-            return
-        
-        # 가장 높은(Y가 작은) 동물의 위치
+        """탑 높이를 계산합니다 (안착한 동물의 현재 위치 기준)."""
+        # 안착한 동물도 밀려 움직일 수 있으므로 매 프레임 현재 위치로 계산
         min_y = PLATFORM_Y
-        for animal in self.animals:
-            if animal.state == AnimalState.SETTLED:
-                y = animal.y - animal.height / 2
-                if y < min_y:
-                    min_y = y
+        for animal in self._settled_animals:
+            y = animal.y - animal.height / 2
+            if y < min_y:
+                min_y = y
         
         self.tower_height = max(0, PLATFORM_Y - min_y)
         self.max_height = max(self.max_height, self.tower_height)
@@ -237,9 +246,14 @@ class GameManager:
         if self.platform:
             self.platform.draw(screen, self.camera)
         
-        # 쌓인 동물들
-        for animal in self.animals:
-            animal.draw(screen, self.camera)
+        # 쌓인 동물들 (중심 좌표를 한 번에 스크린 좌표로 변환)
+        if self.animals:
+            positions = np.array([animal.body.position for animal in self.animals], 
+                                 dtype=np.float64)
+            screen_positions = self.camera.world_to_screen_array(positions).tolist()
+            zoom = self.camera.zoom
+            for animal, screen_pos in zip(self.animals, screen_positions):
+                animal.draw_at(screen, screen_pos, zoom)
         
         # 현재 조종 중인 동물
         if self.current_animal:
@@ -14,6 +14,8 @@ Animal Tower Stacking Game
 필요한 라이브러리:
 - pygame
 - pymunk
+- numpy
+- opencv-python (선택 사항, 충돌 다각형 추출 가속)
 """
 
 import pygame
@@ -25,6 +27,7 @@ from constants import (
 from game_manager import GameManager
 from ui_manager import UIManager
 from background import Background
+from animal import Animal
 
 
 class Game:
@@ -41,6 +44,9 @@ class Game:
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         self.clock = pygame.time.Clock()
         
+        # 동물 이미지/폴리곤 미리 로드 (첫 스폰 시 끊김 방지)
+        Animal.preload_all()
+        
         # 매니저 초기화
         self.game_manager = GameManager()
         self.ui_manager = UIManager()
@@ -49,12 +55,6 @@ class Game:
         # 게임 상태
         self.running = True
         self.debug_mode = False
-        
-        # 입력 상태
-        self.keys_pressed = {
-            'left': False,
-            'right': False
-        }
     
     def run(self):
         """메인 게임 루프를 실행합니다."""
@@ -80,10 +80,6 @@ class Game:
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
-                elif event.key == pygame.K_LEFT:
-                    self.keys_pressed['left'] = True
-                elif event.key == pygame.K_RIGHT:
-                    self.keys_pressed['right'] = True
                 elif event.key == pygame.K_SPACE:
                     key_down_event = 'space'
                 elif event.key == pygame.K_DOWN:
@@ -91,12 +87,6 @@ class Game:
                 elif event.key == pygame.K_F1:
                     self.debug_mode = not self.debug_mode
             
-            elif event.type == pygame.KEYUP:
-                if event.key == pygame.K_LEFT:
-                    self.keys_pressed['left'] = False
-                elif event.key == pygame.K_RIGHT:
-                    self.keys_pressed['right'] = False
-            
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # 왼쪽 클릭
                     mouse_clicked = True
@@ -109,7 +99,7 @@ class Game:
                 self.game_manager.start_game()
         
         elif self.game_manager.state == GameState.PLAYING:
-            self.game_manager.handle_input(self.keys_pressed, key_down_event)
+            self.game_manager.handle_input(pygame.key.get_pressed(), key_down_event)
         
         elif self.game_manager.state == GameState.GAME_OVER:
             if self.ui_manager.check_restart_clicked(mouse_pos, mouse_clicked):
@@ -117,8 +107,9 @@ class Game:
     
     def _update(self, dt: float):
         """게임 상태를 업데이트합니다."""
-        # 배경 업데이트 (구름 이동)
-        self.background.update(dt)
+        # 배경 업데이트 (구름 이동, 게임 오버 화면에서는 정지)
+        if self.game_manager.state != GameState.GAME_OVER:
+            self.background.update(dt)
         
         # 게임 매니저 업데이트
         if self.game_manager.state == GameState.PLAYING:
@@ -6,7 +6,8 @@ Pymunk 물리 공간을 관리하고 시뮬레이션을 처리합니다.
 
 import pymunk
 from constants import (
-    GRAVITY, DAMPING, PHYSICS_STEPS,
+    GRAVITY, DAMPING, PHYSICS_ITERATIONS, PHYSICS_MAX_FRAME_TIME,
+    SLEEP_TIME_THRESHOLD, IDLE_SPEED_THRESHOLD,
     PLATFORM_FRICTION, PLATFORM_ELASTICITY
 )
 
@@ -25,6 +26,17 @@ class PhysicsManager:
         self.space.gravity = GRAVITY
         self.space.damping = DAMPING
         
+        # 서브스텝 대신 솔버 반복 횟수로 안정성 확보 (충돌 검출은 스텝당 한 번)
+        self.space.iterations = PHYSICS_ITERATIONS
+        
+        # 멈춘 동물 더미는 수면 상태로 전환 (솔버가 잠든 섬을 건너뜀)
+        self.space.sleep_time_threshold = SLEEP_TIME_THRESHOLD
+        self.space.idle_speed_threshold = IDLE_SPEED_THRESHOLD
+        
+        # 공간에 추가된 바디/셰이프 추적 (O(1) 포함 여부 확인용)
+        self._bodies = set()
+        self._shapes = set()
+        
         # 충돌 핸들러 설정 (필요시 확장)
         self.setup_collision_handlers()
     
@@ -43,9 +55,10 @@ class PhysicsManager:
             body: Pymunk Body 객체
             shapes: Pymunk Shape 객체 리스트
         """
-        self.space.add(body)
-        for shape in shapes:
-            self.space.add(shape)
+        # 한 번의 호출로 일괄 추가
+        self.space.add(body, *shapes)
+        self._bodies.add(body)
+        self._shapes.update(shapes)
     
     def remove_body(self, body: pymunk.Body, shapes: list):
         """
@@ -55,11 +68,15 @@ class PhysicsManager:
             body: Pymunk Body 객체
             shapes: Pymunk Shape 객체 리스트
         """
-        for shape in shapes:
-            if shape in self.space.shapes:
-                self.space.remove(shape)
-        if body in self.space.bodies:
-            self.space.remove(body)
+        # 공간에 있는 것만 모아 한 번의 호출로 일괄 제거
+        to_remove = [shape for shape in shapes if shape in self._shapes]
+        self._shapes.difference_update(to_remove)
+        if body in self._bodies:
+            self._bodies.discard(body)
+            to_remove.append(body)
+        
+        if to_remove:
+            self.space.remove(*to_remove)
     
     def step(self, dt: float):
         """
@@ -68,10 +85,10 @@ class PhysicsManager:
         Args:
             dt: 델타 타임 (초)
         """
-        # 여러 번 나눠서 시뮬레이션 (정확도 향상)
-        step_dt = dt / PHYSICS_STEPS
-        for _ in range(PHYSICS_STEPS):
-            self.space.step(step_dt)
+        # 프레임당 한 번만 진행 (고정 스텝 누산기는 밀리초 단위 프레임 흔들림에
+        # 스텝 0회/2회 프레임이 생겨 끊겨 보이므로 사용하지 않음)
+        # 멈춤 후 큰 dt로 터널링하지 않도록 상한을 둠
+        self.space.step(min(dt, PHYSICS_MAX_FRAME_TIME))
     
     def create_static_platform(self, x: float, y: float, 
                                width: float, height: float) -> tuple:
@@ -101,6 +118,8 @@ class PhysicsManager:
         shape.collision_type = 2  # 플랫폼 타입
         
         self.space.add(body, shape)
+        self._bodies.add(body)
+        self._shapes.add(shape)
         
         return body, shape
     
@@ -133,14 +152,16 @@ class PhysicsManager:
         right_shape.elasticity = 0.3
         
         self.space.add(left_body, left_shape, right_body, right_shape)
+        self._bodies.update((left_body, right_body))
+        self._shapes.update((left_shape, right_shape))
         
         return (left_body, left_shape), (right_body, right_shape)
     
     def clear(self):
         """물리 공간의 모든 객체를 제거합니다."""
-        for body in list(self.space.bodies):
-            self.space.remove(body)
-        for shape in list(self.space.shapes):
-            self.space.remove(shape)
-        for constraint in list(self.space.constraints):
-            self.space.remove(constraint)
+        # 한 번의 호출로 일괄 제거
+        objects = [*self.space.shapes, *self.space.bodies, *self.space.constraints]
+        if objects:
+            self.space.remove(*objects)
+        self._bodies.clear()
+        self._shapes.clear()
@@ -5,6 +5,7 @@
 """
 
 import pygame
+from typing import Optional, Tuple
 from constants import (
     SCREEN_WIDTH, PLATFORM_WIDTH, PLATFORM_HEIGHT, PLATFORM_Y,
     GRASS_GREEN, GRASS_DARK, GROUND_BROWN
@@ -43,6 +44,14 @@ class Platform:
             self.width,
             self.height
         )
+        
+        # 미리 그린 플랫폼 서피스 (화면상 크기가 바뀔 때만 다시 그림)
+        self._cached_surf: Optional[pygame.Surface] = None
+        self._cached_key: Optional[Tuple[int, int]] = None
+        
+        # 마지막 카메라 상태와 그때의 화면 좌표 (카메라가 멈춰 있으면 재사용)
+        self._last_camera_state: Optional[tuple] = None
+        self._screen_corners: Optional[tuple] = None
     
     def draw(self, screen: pygame.Surface, camera):
         """
@@ -52,15 +61,21 @@ class Platform:
             screen: Pygame 화면 Surface
             camera: Camera 인스턴스
         """
-        # 화면 좌표로 변환
-        left_top = camera.world_to_screen(
-            self.x - self.width / 2,
-            self.y - self.height / 2
-        )
-        right_bottom = camera.world_to_screen(
-            self.x + self.width / 2,
-            self.y + self.height / 2
-        )
+        # 화면 좌표로 변환 (플랫폼은 움직이지 않으므로 카메라 상태가 같으면 재사용)
+        camera_state = camera.state
+        if camera_state != self._last_camera_state:
+            left_top = camera.world_to_screen(
+                self.x - self.width / 2,
+                self.y - self.height / 2
+            )
+            right_bottom = camera.world_to_screen(
+                self.x + self.width / 2,
+                self.y + self.height / 2
+            )
+            self._screen_corners = (left_top, right_bottom)
+            self._last_camera_state = camera_state
+        
+        left_top, right_bottom = self._screen_corners
         
         # 스케일된 크기 계산
         screen_width = right_bottom[0] - left_top[0]
@@ -69,36 +84,45 @@ class Platform:
         if screen_width < 1 or screen_height < 1:
             return
         
+        # 화면 밖이면 생략 (AABB 컬링)
+        if (right_bottom[1] < 0 or left_top[1] > screen.get_height() or
+                right_bottom[0] < 0 or left_top[0] > screen.get_width()):
+            return
+        
+        key = (int(screen_width), int(screen_height))
+        if key != self._cached_key:
+            self._cached_surf = self._render_surface(key)
+            self._cached_key = key
+        
+        screen.blit(self._cached_surf, (int(left_top[0]), int(left_top[1])))
+    
+    def _render_surface(self, size: Tuple[int, int]) -> pygame.Surface:
+        """
+        주어진 화면상 크기로 플랫폼 모양을 그린 서피스를 생성합니다.
+        
+        Args:
+            size: (너비, 높이) 픽셀
+        """
+        width, height = size
+        surface = pygame.Surface(size)
+        
         # 플랫폼 메인 (갈색)
-        platform_rect = pygame.Rect(
-            int(left_top[0]),
-            int(left_top[1]),
-            int(screen_width),
-            int(screen_height)
-        )
-        pygame.draw.rect(screen, GROUND_BROWN, platform_rect)
+        platform_rect = surface.get_rect()
+        pygame.draw.rect(surface, GROUND_BROWN, platform_rect)
         
         # 잔디 레이어 (상단)
-        grass_height = max(2, int(screen_height * 0.4))
-        grass_rect = pygame.Rect(
-            int(left_top[0]),
-            int(left_top[1]),
-            int(screen_width),
-            grass_height
-        )
-        pygame.draw.rect(screen, GRASS_GREEN, grass_rect)
+        grass_height = max(2, int(height * 0.4))
+        grass_rect = pygame.Rect(0, 0, width, grass_height)
+        pygame.draw.rect(surface, GRASS_GREEN, grass_rect)
         
         # 잔디 하이라이트
-        highlight_rect = pygame.Rect(
-            int(left_top[0]),
-            int(left_top[1]),
-            int(screen_width),
-            max(1, grass_height // 3)
-        )
-        pygame.draw.rect(screen, GRASS_DARK, highlight_rect)
+        highlight_rect = pygame.Rect(0, 0, width, max(1, grass_height // 3))
+        pygame.draw.rect(surface, GRASS_DARK, highlight_rect)
         
         # 테두리
-        pygame.draw.rect(screen, GRASS_DARK, platform_rect, 2)
+        pygame.draw.rect(surface, GRASS_DARK, platform_rect, 2)
+        
+        return surface.convert()
     
     def draw_ground(self, screen: pygame.Surface, camera):
         """
@@ -112,11 +136,13 @@ class Platform:
         ground_top_world = self.y + self.height / 2
         ground_top_screen = camera.world_to_screen(0, ground_top_world)[1]
         
+        # 땅이 화면 아래에 있으면 생략, 화면 위로 넘어가는 부분은 잘라냄
         if ground_top_screen < screen.get_height():
+            ground_top = max(0, int(ground_top_screen))
             ground_rect = pygame.Rect(
                 0,
-                int(ground_top_screen),
+                ground_top,
                 screen.get_width(),
-                screen.get_height() - int(ground_top_screen)
+                screen.get_height() - ground_top
             )
             pygame.draw.rect(screen, GROUND_BROWN, ground_rect)
@@ -6,8 +6,84 @@
 
 import pygame
 import math
+import os
+import hashlib
+import functools
+import inspect
+import json
+import tempfile
+import numpy as np
 from typing import List, Tuple
 
+from constants import POLYGON_CACHE_DIR
+
+# OpenCV가 있으면 윤곽선/단순화/볼록 껍질을 C 구현으로 처리 (선택 사항)
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+# 디스크 캐시 형식/추출 알고리즘 버전 (추출 코드를 바꾸면 올려서 이전 캐시 무효화)
+POLYGON_CACHE_VERSION = 2
+
+
+def _disk_cached(func):
+    """
+    추출 결과를 이미지 픽셀 해시 기준으로 디스크에 캐시하는 데코레이터.
+    
+    같은 이미지와 설정이면 다음 실행부터 추출 과정을 생략합니다.
+    캐시 읽기/쓰기에 실패하면 그냥 다시 추출합니다.
+    """
+    signature = inspect.signature(func)
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs) -> List[Tuple[float, float]]:
+        # 실제 함수의 기본값을 적용한 인자로 캐시 키 구성
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        surface = bound.arguments.pop("surface")
+        params = {
+            "version": POLYGON_CACHE_VERSION,
+            "args": bound.arguments,
+            "cv2": cv2.__version__ if cv2 is not None else None,
+        }
+        
+        digest = hashlib.sha1(pygame.image.tobytes(surface, 'RGBA'))
+        digest.update(json.dumps([surface.get_size(), params], sort_keys=True).encode())
+        path = os.path.join(POLYGON_CACHE_DIR, digest.hexdigest() + ".json")
+        
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            if cached["params"] == params:
+                return [tuple(v) for v in cached["vertices"]]
+        except (OSError, ValueError):
+            pass
+        
+        vertices = func(*args, **kwargs)
+        
+        tmp_path = None
+        try:
+            os.makedirs(POLYGON_CACHE_DIR, exist_ok=True)
+            # 고유한 임시 파일에 쓴 뒤 교체 (다른 프로세스/스레드와 동시에 써도 깨지지 않음)
+            fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=POLYGON_CACHE_DIR)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"params": params,
+                           "vertices": [[float(x), float(y)] for x, y in vertices]}, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"폴리곤 캐시 저장 실패: {e}")
+        finally:
+            # 교체되지 못한 임시 파일 정리
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+        
+        return vertices
+    
+    return wrapper
+
+
+@_disk_cached
 def extract_polygon_from_surface(surface: pygame.Surface, 
                                   simplify_tolerance: float = 2.0,
                                   max_vertices: int = 16) -> List[Tuple[float, float]]:
@@ -22,6 +98,9 @@ def extract_polygon_from_surface(surface: pygame.Surface,
     Returns:
         중심점 기준 (x, y) 좌표 리스트
     """
+    if cv2 is not None:
+        return _extract_polygon_cv2(surface, simplify_tolerance, max_vertices)
+    
     width = surface.get_width()
     height = surface.get_height()
     
@@ -36,18 +115,55 @@ def extract_polygon_from_surface(surface: pygame.Surface,
         hw, hh = width / 2, height / 2
         return [(-hw, -hh), (hw, -hh), (hw, hh), (-hw, hh)]
     
-    # 중심점 기준으로 좌표 변환
-    center_x = width / 2
-    center_y = height / 2
-    
-    centered_outline = [(x - center_x, y - center_y) for x, y in outline]
+    # 중심점 기준으로 좌표 변환 (이후 단순화는 (N, 2) 배열로 처리)
+    center = np.array((width / 2, height / 2))
+    centered_outline = np.asarray(outline, dtype=np.float64) - center
     
     # 다각형 단순화 (Douglas-Peucker 알고리즘 기반)
     simplified = simplify_polygon(centered_outline, simplify_tolerance)
     
     # 볼록 껍질로 변환 (Pymunk은 볼록 다각형만 지원)
-    convex = convex_hull(simplified)
+    convex = convex_hull([tuple(p) for p in simplified.tolist()])
+    
+    return _finalize_polygon(convex, max_vertices)
+
+
+def _extract_polygon_cv2(surface: pygame.Surface, 
+                         simplify_tolerance: float,
+                         max_vertices: int) -> List[Tuple[float, float]]:
+    """OpenCV로 윤곽선 추출, 볼록 껍질, 단순화를 처리합니다."""
+    width = surface.get_width()
+    height = surface.get_height()
+    hw, hh = width / 2, height / 2
+    
+    # 알파 채널 이진화 - 투명하지 않은 픽셀 찾기 (surfarray는 (W, H) 순서)
+    alpha = np.ascontiguousarray(pygame.surfarray.array_alpha(surface).T)
+    _, binary = cv2.threshold(alpha, 50, 255, cv2.THRESH_BINARY)
+    
+    # 가장 큰 외곽 윤곽선 (OpenCV 버전에 따라 반환값 개수가 다름)
+    contours = cv2.findContours(binary, cv2.RETR_EXTERNAL, 
+                                cv2.CHAIN_APPROX_SIMPLE)[-2]
+    if not contours:
+        return [(-hw, -hh), (hw, -hh), (hw, hh), (-hw, hh)]
+    contour = max(contours, key=cv2.contourArea)
+    
+    # 볼록 껍질 후 단순화 (볼록 다각형의 부분 집합이므로 볼록성 유지)
+    hull = cv2.convexHull(contour)
+    approx = cv2.approxPolyDP(hull, simplify_tolerance, True)
+    
+    if len(approx) < 3:
+        return [(-hw, -hh), (hw, -hh), (hw, hh), (-hw, hh)]
+    
+    # 중심점 기준으로 좌표 변환
+    points = approx.reshape(-1, 2).astype(np.float64) - (hw, hh)
+    convex = [tuple(p) for p in points.tolist()]
     
+    return _finalize_polygon(convex, max_vertices)
+
+
+def _finalize_polygon(convex: List[Tuple[float, float]], 
+                      max_vertices: int) -> List[Tuple[float, float]]:
+    """꼭짓점 수를 제한하고 반시계 방향으로 정렬합니다."""
     # 최대 꼭짓점 수 제한
     if len(convex) > max_vertices:
         convex = reduce_vertices(convex, max_vertices)
@@ -59,56 +175,66 @@ def extract_polygon_from_surface(surface: pygame.Surface,
     return convex
 
 
-def simplify_polygon(points: List[Tuple[float, float]], 
-                     tolerance: float) -> List[Tuple[float, float]]:
+def simplify_polygon(points: np.ndarray, tolerance: float) -> np.ndarray:
     """
     Douglas-Peucker 알고리즘으로 다각형을 단순화합니다.
+    
+    재귀 대신 구간 스택과 유지 마스크를 사용합니다 (구간별 리스트 복사 없음).
+    OpenCV가 설치되어 있으면 extract_polygon_from_surface는 이 함수 대신
+    C 구현인 cv2.approxPolyDP를 사용하며, 이 함수는 그 폴백입니다.
+    
+    Args:
+        points: (N, 2) 좌표 배열
+        tolerance: 단순화 허용치
+    
+    Returns:
+        단순화된 (M, 2) 좌표 배열
     """
-    if len(points) <= 3:
+    n = len(points)
+    if n <= 3:
         return points
     
-    # 가장 먼 점 찾기
-    max_dist = 0
-    max_idx = 0
+    keep = np.ones(n, dtype=bool)
+    stack = [(0, n - 1)]
     
-    start = points[0]
-    end = points[-1]
+    while stack:
+        lo, hi = stack.pop()
+        
+        # 점이 3개 이하인 구간은 그대로 유지
+        if hi - lo < 3:
+            continue
+        
+        # 가장 먼 점 찾기 (양 끝점을 제외한 구간 내 모든 점의 거리를 한 번에 계산)
+        distances = perpendicular_distances(points[lo + 1:hi], points[lo], points[hi])
+        max_offset = int(distances.argmax())
+        
+        # 허용치보다 멀면 분할, 아니면 내부 점 제거
+        if distances[max_offset] > tolerance:
+            max_idx = lo + 1 + max_offset
+            stack.append((lo, max_idx))
+            stack.append((max_idx, hi))
+        else:
+            keep[lo + 1:hi] = False
     
-    for i in range(1, len(points) - 1):
-        dist = perpendicular_distance(points[i], start, end)
-        if dist > max_dist:
-            max_dist = dist
-            max_idx = i
-    
-    # 허용치보다 멀면 분할하여 재귀
-    if max_dist > tolerance:
-        left = simplify_polygon(points[:max_idx + 1], tolerance)
-        right = simplify_polygon(points[max_idx:], tolerance)
-        return left[:-1] + right
-    else:
-        return [start, end]
+    return points[keep]
 
 
-def perpendicular_distance(point: Tuple[float, float],
-                          line_start: Tuple[float, float],
-                          line_end: Tuple[float, float]) -> float:
-    """점에서 선분까지의 수직 거리를 계산합니다."""
-    x, y = point
-    x1, y1 = line_start
-    x2, y2 = line_end
-    
-    dx = x2 - x1
-    dy = y2 - y1
+def perpendicular_distances(points: np.ndarray,
+                            line_start: np.ndarray,
+                            line_end: np.ndarray) -> np.ndarray:
+    """여러 점에서 선분까지의 수직 거리를 한 번에 계산합니다."""
+    delta = line_end - line_start
+    length_sq = delta[0] * delta[0] + delta[1] * delta[1]
     
-    if dx == 0 and dy == 0:
-        return math.sqrt((x - x1) ** 2 + (y - y1) ** 2)
+    offsets = points - line_start
+    if length_sq == 0:
+        return np.hypot(offsets[:, 0], offsets[:, 1])
     
-    t = max(0, min(1, ((x - x1) * dx + (y - y1) * dy) / (dx * dx + dy * dy)))
+    # 선분 위 투영 비율 (0~1로 제한)
+    t = np.clip(offsets @ delta / length_sq, 0.0, 1.0)
     
-    proj_x = x1 + t * dx
-    proj_y = y1 + t * dy
-    
-    return math.sqrt((x - proj_x) ** 2 + (y - proj_y) ** 2)
+    diff = offsets - t[:, None] * delta
+    return np.hypot(diff[:, 0], diff[:, 1])
 
 
 def convex_hull(points: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
@@ -118,43 +244,44 @@ def convex_hull(points: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
     if len(points) < 3:
         return points
     
-    # 가장 아래-왼쪽 점을 시작점으로
-    start = min(points, key=lambda p: (p[1], p[0]))
+    arr = np.asarray(points, dtype=np.float64)
+    
+    # 가장 아래-왼쪽 점을 시작점으로 (y 우선, 같으면 x)
+    start = arr[np.lexsort((arr[:, 0], arr[:, 1]))[0]]
     
-    def polar_angle(p):
-        if p == start:
-            return -math.pi
-        return math.atan2(p[1] - start[1], p[0] - start[0])
+    # 극좌표 각도를 한 번에 계산 (시작점과 같은 점은 맨 앞)
+    offsets = arr - start
+    angles = np.arctan2(offsets[:, 1], offsets[:, 0])
+    angles[(offsets[:, 0] == 0) & (offsets[:, 1] == 0)] = -np.pi
     
-    # 극좌표 각도로 정렬
-    sorted_points = sorted(points, key=polar_angle)
+    # 극좌표 각도로 정렬 (같은 각도는 입력 순서 유지)
+    order = np.argsort(angles, kind="stable")
+    sorted_points = [points[i] for i in order.tolist()]
     
-    # 스택으로 볼록 껍질 구성
-    hull = []
+    # 스택으로 볼록 껍질 구성 (미리 할당한 스택 + top 인덱스, 외적은 인라인 계산)
+    hull = [None] * len(sorted_points)
+    top = 0
     for p in sorted_points:
-        while len(hull) >= 2 and cross_product(hull[-2], hull[-1], p) <= 0:
-            hull.pop()
-        hull.append(p)
+        px, py = p
+        while top >= 2:
+            ox, oy = hull[top - 2]
+            ax, ay = hull[top - 1]
+            # 외적 (a - o) x (p - o) > 0 (반시계 방향 회전)이면 유지
+            if (ax - ox) * (py - oy) - (ay - oy) * (px - ox) > 0:
+                break
+            top -= 1
+        hull[top] = p
+        top += 1
     
-    return hull
-
-
-def cross_product(o: Tuple[float, float], 
-                  a: Tuple[float, float], 
-                  b: Tuple[float, float]) -> float:
-    """세 점의 외적을 계산합니다 (방향 판별용)."""
-    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+    return hull[:top]
 
 
 def is_counter_clockwise(points: List[Tuple[float, float]]) -> bool:
-    """다각형이 반시계 방향인지 확인합니다."""
-    area = 0
-    n = len(points)
-    for i in range(n):
-        j = (i + 1) % n
-        area += points[i][0] * points[j][1]
-        area -= points[j][0] * points[i][1]
-    return area > 0
+    """다각형이 반시계 방향인지 확인합니다 (신발끈 공식을 한 번에 계산)."""
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    x, y = pts[:, 0], pts[:, 1]
+    area = (x * np.roll(y, -1) - np.roll(x, -1) * y).sum()
+    return bool(area > 0)
 
 
 def reduce_vertices(points: List[Tuple[float, float]], 
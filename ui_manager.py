@@ -5,15 +5,16 @@ UI 매니저 (UI Manager)
 """
 
 import pygame
-import os
+from collections import OrderedDict
 from constants import (
     SCREEN_WIDTH, SCREEN_HEIGHT,
-    IMAGES_PATH, ANIMAL_IMAGES, ANIMAL_SCALE,
+    ANIMAL_SCALE,
     NEXT_PREVIEW_SIZE, NEXT_PREVIEW_POS, SCORE_POS,
     WHITE, BLACK, UI_BG, UI_BORDER, SCORE_COLOR,
     TITLE_COLOR, BUTTON_COLOR, BUTTON_HOVER, BUTTON_TEXT,
     SKY_BLUE_LIGHT
 )
+from animal import SPECIES
 
 
 class Button:
@@ -25,6 +26,26 @@ class Button:
         self.text = text
         self.font = font
         self.is_hovered = False
+        
+        # 상태별 버튼 모양을 미리 그려둠 (매 프레임 도형/텍스트 렌더링 생략)
+        self._surf_normal = self._render(BUTTON_COLOR)
+        self._surf_hover = self._render(BUTTON_HOVER)
+    
+    def _render(self, color: tuple) -> pygame.Surface:
+        """주어진 배경색으로 버튼 Surface를 생성합니다."""
+        surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        local_rect = surface.get_rect()
+        
+        # 버튼 배경 (둥근 모서리)
+        pygame.draw.rect(surface, color, local_rect, border_radius=10)
+        pygame.draw.rect(surface, WHITE, local_rect, 3, border_radius=10)
+        
+        # 텍스트
+        text_surface = self.font.render(self.text, True, BUTTON_TEXT)
+        text_rect = text_surface.get_rect(center=local_rect.center)
+        surface.blit(text_surface, text_rect)
+        
+        return surface.convert_alpha()
     
     def update(self, mouse_pos: tuple):
         """마우스 호버 상태 업데이트"""
@@ -36,16 +57,8 @@ class Button:
     
     def draw(self, screen: pygame.Surface):
         """버튼 그리기"""
-        color = BUTTON_HOVER if self.is_hovered else BUTTON_COLOR
-        
-        # 버튼 배경 (둥근 모서리)
-        pygame.draw.rect(screen, color, self.rect, border_radius=10)
-        pygame.draw.rect(screen, WHITE, self.rect, 3, border_radius=10)
-        
-        # 텍스트
-        text_surface = self.font.render(self.text, True, BUTTON_TEXT)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+        surface = self._surf_hover if self.is_hovered else self._surf_normal
+        screen.blit(surface, self.rect)
 
 
 class UIManager:
@@ -56,6 +69,8 @@ class UIManager:
     - 메뉴/게임오버 화면
     """
     
+    TEXT_CACHE_SIZE = 64  # 텍스트 캐시 최대 항목 수
+    
     def __init__(self):
         """UI 매니저를 초기화합니다."""
         pygame.font.init()
@@ -83,32 +98,42 @@ class UIManager:
             200, 60, "RESTART", self.font_medium
         )
         
-        # 미리보기 이미지 캐시
-        self.preview_images = {}
-        self._load_preview_images()
+        # 렌더링된 텍스트 캐시 (font, text, color) -> Surface, 최근 항목만 유지
+        self._text_cache: OrderedDict = OrderedDict()
+        
+        # 반투명 배경/오버레이 (매 프레임 생성하지 않도록 미리 만들어 재사용)
+        self._title_overlay = self._create_overlay((SCREEN_WIDTH, SCREEN_HEIGHT), 
+                                                   (255, 255, 255, 180))
+        self._gameover_overlay = self._create_overlay((SCREEN_WIDTH, SCREEN_HEIGHT), 
+                                                      (0, 0, 0, 150))
+        
+        self._score_bg_rect = pygame.Rect(SCORE_POS[0] - 10, SCORE_POS[1] - 5, 180, 70)
+        self._score_bg = self._create_overlay(self._score_bg_rect.size, UI_BG)
+        
+        preview_x, preview_y = NEXT_PREVIEW_POS
+        preview_w, preview_h = NEXT_PREVIEW_SIZE
+        self._preview_bg_rect = pygame.Rect(preview_x, preview_y, preview_w, preview_h + 30)
+        self._preview_bg = self._create_overlay(self._preview_bg_rect.size, UI_BG)
+    
+    @staticmethod
+    def _create_overlay(size: tuple, color: tuple) -> pygame.Surface:
+        """단색으로 채운 반투명 Surface를 생성합니다."""
+        overlay = pygame.Surface(size, pygame.SRCALPHA)
+        overlay.fill(color)
+        return overlay
     
-    def _load_preview_images(self):
-        """미리보기용 작은 이미지들을 로드합니다."""
-        preview_scale = 0.08  # 미리보기용 작은 스케일
-        
-        for image_name in ANIMAL_IMAGES:
-            try:
-                path = os.path.join(IMAGES_PATH, image_name)
-                original = pygame.image.load(path).convert_alpha()
-                
-                # 미리보기 크기에 맞게 조정
-                aspect = original.get_width() / original.get_height()
-                preview_height = NEXT_PREVIEW_SIZE[1] - 20
-                preview_width = int(preview_height * aspect)
-                
-                if preview_width > NEXT_PREVIEW_SIZE[0] - 20:
-                    preview_width = NEXT_PREVIEW_SIZE[0] - 20
-                    preview_height = int(preview_width / aspect)
-                
-                scaled = pygame.transform.smoothscale(original, (preview_width, preview_height))
-                self.preview_images[image_name] = scaled
-            except Exception as e:
-                print(f"미리보기 이미지 로드 실패 ({image_name}): {e}")
+    def _render(self, font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+        """텍스트를 렌더링합니다 (같은 내용이면 캐시된 Surface 재사용)."""
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color)
+            self._text_cache[key] = surface
+            if len(self._text_cache) > self.TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return surface
     
     def draw_score(self, screen: pygame.Surface, score: int, height: float):
         """
@@ -120,18 +145,15 @@ class UIManager:
             height: 현재 탑 높이
         """
         # 점수 배경
-        bg_rect = pygame.Rect(SCORE_POS[0] - 10, SCORE_POS[1] - 5, 180, 70)
-        bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-        bg_surface.fill(UI_BG)
-        screen.blit(bg_surface, bg_rect)
-        pygame.draw.rect(screen, UI_BORDER, bg_rect, 2, border_radius=5)
+        screen.blit(self._score_bg, self._score_bg_rect)
+        pygame.draw.rect(screen, UI_BORDER, self._score_bg_rect, 2, border_radius=5)
         
         # 점수 텍스트
-        score_text = self.font_small.render(f"Score: {score}", True, SCORE_COLOR)
+        score_text = self._render(self.font_small, f"Score: {score}", SCORE_COLOR)
         screen.blit(score_text, (SCORE_POS[0], SCORE_POS[1]))
         
         # 높이 표시
-        height_text = self.font_small.render(f"Height: {int(height)}px", True, WHITE)
+        height_text = self._render(self.font_small, f"Height: {int(height)}px", WHITE)
         screen.blit(height_text, (SCORE_POS[0], SCORE_POS[1] + 30))
     
     def draw_next_preview(self, screen: pygame.Surface, next_animal_name: str):
@@ -146,20 +168,17 @@ class UIManager:
         w, h = NEXT_PREVIEW_SIZE
         
         # 배경 박스
-        bg_rect = pygame.Rect(x, y, w, h + 30)
-        bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-        bg_surface.fill(UI_BG)
-        screen.blit(bg_surface, bg_rect)
-        pygame.draw.rect(screen, UI_BORDER, bg_rect, 2, border_radius=5)
+        screen.blit(self._preview_bg, self._preview_bg_rect)
+        pygame.draw.rect(screen, UI_BORDER, self._preview_bg_rect, 2, border_radius=5)
         
         # "NEXT" 라벨
-        next_label = self.font_small.render("NEXT", True, WHITE)
+        next_label = self._render(self.font_small, "NEXT", WHITE)
         label_rect = next_label.get_rect(centerx=x + w // 2, top=y + 5)
         screen.blit(next_label, label_rect)
         
-        # 동물 이미지
-        if next_animal_name in self.preview_images:
-            preview = self.preview_images[next_animal_name]
+        # 동물 이미지 (Animal.preload_all()에서 만든 미리보기 사용)
+        if next_animal_name:
+            preview = SPECIES[next_animal_name]["preview"]
             img_rect = preview.get_rect(center=(x + w // 2, y + 30 + h // 2))
             screen.blit(preview, img_rect)
     
@@ -172,17 +191,15 @@ class UIManager:
             mouse_pos: 마우스 위치
         """
         # 반투명 오버레이
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((255, 255, 255, 180))
-        screen.blit(overlay, (0, 0))
+        screen.blit(self._title_overlay, (0, 0))
         
         # 타이틀
-        title_text = self.font_korean_large.render("동물 탑 쌓기", True, TITLE_COLOR)
+        title_text = self._render(self.font_korean_large, "동물 탑 쌓기", TITLE_COLOR)
         title_rect = title_text.get_rect(centerx=SCREEN_WIDTH // 2, centery=SCREEN_HEIGHT // 3)
         screen.blit(title_text, title_rect)
         
         # 부제목
-        subtitle = self.font_korean.render("Animal Tower Stacking", True, TITLE_COLOR)
+        subtitle = self._render(self.font_korean, "Animal Tower Stacking", TITLE_COLOR)
         subtitle_rect = subtitle.get_rect(centerx=SCREEN_WIDTH // 2, centery=SCREEN_HEIGHT // 3 + 60)
         screen.blit(subtitle, subtitle_rect)
         
@@ -191,7 +208,7 @@ class UIManager:
         self.start_button.draw(screen)
         
         # 조작법 안내
-        controls = self.font_small.render("← → : Move   |   SPACE / ↓ : Drop", True, BLACK)
+        controls = self._render(self.font_small, "← → : Move   |   SPACE / ↓ : Drop", BLACK)
         controls_rect = controls.get_rect(centerx=SCREEN_WIDTH // 2, bottom=SCREEN_HEIGHT - 30)
         screen.blit(controls, controls_rect)
     
@@ -207,24 +224,22 @@ class UIManager:
             mouse_pos: 마우스 위치
         """
         # 반투명 오버레이
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        screen.blit(overlay, (0, 0))
+        screen.blit(self._gameover_overlay, (0, 0))
         
         # 게임 오버 텍스트
-        game_over_text = self.font_large.render("GAME OVER", True, WHITE)
+        game_over_text = self._render(self.font_large, "GAME OVER", WHITE)
         go_rect = game_over_text.get_rect(centerx=SCREEN_WIDTH // 2, 
                                           centery=SCREEN_HEIGHT // 3)
         screen.blit(game_over_text, go_rect)
         
         # 점수 표시
-        score_text = self.font_medium.render(f"Score: {score}", True, SCORE_COLOR)
+        score_text = self._render(self.font_medium, f"Score: {score}", SCORE_COLOR)
         score_rect = score_text.get_rect(centerx=SCREEN_WIDTH // 2, 
                                          centery=SCREEN_HEIGHT // 2 - 20)
         screen.blit(score_text, score_rect)
         
         # 높이 표시
-        height_text = self.font_medium.render(f"Max Height: {int(height)}px", True, WHITE)
+        height_text = self._render(self.font_medium, f"Max Height: {int(height)}px", WHITE)
         height_rect = height_text.get_rect(centerx=SCREEN_WIDTH // 2, 
                                            centery=SCREEN_HEIGHT // 2 + 30)
         screen.blit(height_text, height_rect)